@@ -117,7 +117,8 @@ def run_nf_core():
             highlight=False,
         )
         try:
-            is_outdated, _, remote_vers = check_if_outdated()
+            # Don't hold up the command for more than half a second on a slow connection
+            is_outdated, _, remote_vers = check_if_outdated(timeout=0.5)
             if is_outdated:
                 stderr.print(
                     f"[bold bright_yellow]    There is a new version of nf-core/tools available! ({remote_vers})",
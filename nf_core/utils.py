@@ -16,30 +16,35 @@ import os
 import random
 import re
 import shlex
+import struct
 import subprocess
 import sys
+import threading
 import time
 from collections.abc import Callable, Generator
 from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal
 
-import git
 import prompt_toolkit.styles
 import questionary
+import requests.adapters
 import requests.auth
 import requests_cache
 import rich
 import rich.markup
 import yaml
-from packaging.version import Version
+from packaging.version import InvalidVersion, Version
 from pydantic import BaseModel, ValidationError, field_validator
 from rich.live import Live
 from rich.spinner import Spinner
+from urllib3.util.retry import Retry
 
 import nf_core
 
 if TYPE_CHECKING:
+    import git
+
     from nf_core.pipelines.schema import PipelineSchema
 
 log = logging.getLogger(__name__)
@@ -93,6 +98,28 @@ NFCORE_CACHE_DIR = Path(
 )
 NFCORE_DIR = Path(os.environ.get("XDG_CONFIG_HOME", os.path.join(os.getenv("HOME") or "", ".config")), "nfcore")
 
+# Result of the last nf-core/tools version check, reused for VERSION_CHECK_CACHE_TTL seconds
+VERSION_CHECK_CACHE = Path(NFCORE_CACHE_DIR, "version_check.json")
+VERSION_CHECK_CACHE_TTL = 6 * 60 * 60
+
+# Session for polling the nf-core web API, so that repeated calls reuse one connection and survive brief hiccups
+nfcore_web_session = requests.Session()
+nfcore_web_session.mount(
+    "https://",
+    requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=Retry(total=3, backoff_factor=0.2)),
+)
+
+# Safe YAML loader, using the faster libyaml C parser if PyYAML was built with it
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Directories that are never part of a pipeline, skipped when listing files without git
+PIPELINE_IGNORE_DIRS = {".git", "work", ".nextflow", ".cache", "node_modules"}
+
+# Anything that isn't part of a plain dotted version number
+VERSION_CLEAN_RE = re.compile(r"[^0-9\.]")
+# Nextflow version in `manifest.nextflowVersion`, for example `!>=25.04.0`
+NF_VERSION_RE = re.compile(r"[0-9\.]+(-edge)?")
+
 
 def unquote(s: str) -> str:
     """
@@ -114,8 +141,9 @@ def unquote(s: str) -> str:
 
 
 def fetch_remote_version(source_url):
+    # Not nfcore_web_session, as retries would hold up the version check on a slow connection
     response = requests.get(source_url, timeout=3)
-    remote_version = re.sub(r"[^0-9\.]", "", response.text)
+    remote_version = VERSION_CLEAN_RE.sub("", response.text)
     return remote_version
 
 
@@ -123,9 +151,14 @@ def check_if_outdated(
     current_version=None,
     remote_version=None,
     source_url="https://nf-co.re/tools_version",
+    timeout=None,
 ):
     """
     Check if the current version of nf-core is outdated
+
+    The remote version is fetched in a daemon thread. If ``timeout`` seconds pass
+    without a response, give up and report the current version as up to date.
+    The outcome of each check, including failures, is reused for ``VERSION_CHECK_CACHE_TTL`` seconds.
     """
     # Exit immediately if disabled via ENV var
     if os.environ.get("NFCORE_NO_VERSION_CHECK", False):
@@ -133,22 +166,79 @@ def check_if_outdated(
     # Set and clean up the current version string
     if current_version is None:
         current_version = nf_core.__version__
-    current_version = re.sub(r"[^0-9\.]", "", current_version)
+    current_version = VERSION_CLEAN_RE.sub("", current_version)
     # Build the URL to check against
     source_url = os.environ.get("NFCORE_VERSION_URL", source_url)
     source_url = f"{source_url}?v={current_version}"
     # check if we have a newer version without blocking the rest of the script
     is_outdated = False
     if remote_version is None:  # we set it manually for tests
+        cache_file = VERSION_CHECK_CACHE
+        cached_check = None
         try:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(fetch_remote_version, source_url)
-                remote_version = future.result()
-        except Exception as e:
-            log.debug(f"Could not check for nf-core updates: {e}")
+            with open(cache_file) as fh:
+                cached_check = json.load(fh)
+            if (
+                cached_check["source_url"] != source_url
+                or time.time() - cached_check["timestamp"] > VERSION_CHECK_CACHE_TTL
+            ):
+                cached_check = None
+        except (OSError, ValueError, KeyError, TypeError):
+            cached_check = None
+
+        if cached_check is not None:
+            log.debug(f"Using nf-core version check from {cache_file}")
+            remote_version = cached_check["remote_version"]
+        else:
+            future = concurrent.futures.Future()
+            # Held while saving, so that a timed out check can't overwrite the result of the background thread
+            save_lock = threading.Lock()
+            fetch_saved = threading.Event()
+
+            def save_version_check(fetched_version):
+                # Save failures too, so that an unreachable server doesn't slow down every run
+                try:
+                    cache_file.parent.mkdir(parents=True, exist_ok=True)
+                    with open(cache_file, "w") as fh:
+                        json.dump(
+                            {"timestamp": time.time(), "source_url": source_url, "remote_version": fetched_version}, fh
+                        )
+                except OSError as e:
+                    log.debug(f"Could not save nf-core version check to {cache_file}: {e}")
+
+            def fetch_in_background():
+                fetched_version = None
+                fetch_error = None
+                try:
+                    fetched_version = fetch_remote_version(source_url)
+                except Exception as e:
+                    fetch_error = e
+                with save_lock:
+                    save_version_check(fetched_version)
+                    fetch_saved.set()
+                if fetch_error is not None:
+                    future.set_exception(fetch_error)
+                else:
+                    future.set_result(fetched_version)
+
+            # Use a daemon thread, so that a slow response never delays exiting the CLI
+            threading.Thread(target=fetch_in_background, name="nf-core-version-check", daemon=True).start()
+            try:
+                remote_version = future.result(timeout=timeout)
+            except concurrent.futures.TimeoutError:
+                log.debug(f"Timed out after {timeout}s checking for nf-core updates")
+                # The CLI may exit before the background thread finishes, so record the attempt here
+                with save_lock:
+                    if not fetch_saved.is_set():
+                        save_version_check(None)
+            except Exception as e:
+                log.debug(f"Could not check for nf-core updates: {e}")
     if remote_version is not None:
-        if Version(remote_version) > Version(current_version):
-            is_outdated = True
+        try:
+            if Version(remote_version) > Version(current_version):
+                is_outdated = True
+        except InvalidVersion as e:
+            log.debug(f"Could not compare nf-core versions: {e}")
     return (is_outdated, current_version, remote_version)
 
 
@@ -161,6 +251,25 @@ def rich_force_colors():
     return None
 
 
+def _scan_files(directory: str | Path) -> Generator[str, None, None]:
+    """Recursively yield the paths of all files in a directory, skipping ``PIPELINE_IGNORE_DIRS``
+
+    Uses ``os.scandir``, so file types usually come from the directory listing without a ``stat`` call.
+    Directories that can't be read are skipped.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    # Don't descend into run / cache directories, which can hold huge numbers of files
+                    if entry.name not in PIPELINE_IGNORE_DIRS:
+                        yield from _scan_files(entry.path)
+                elif entry.is_file():
+                    yield entry.path
+    except OSError as e:
+        log.debug(f"Could not list files in '{directory}': {e}")
+
+
 class Pipeline:
     """Object to hold information about a local pipeline.
 
@@ -172,6 +281,7 @@ class Pipeline:
         conda_package_info (dict): The conda package(s) information, based on the API requests to Anaconda cloud.
         nf_config (dict): The Nextflow pipeline configuration file content.
         files (list): A list of files found during the linting process.
+        git_info (dict): The git mode and object hash of each tracked file, filled by :meth:`list_files`.
         git_sha (str): The git sha for the repo commit / current GitHub pull-request (`$GITHUB_PR_COMMIT`)
         minNextflowVersion (str): The minimum required Nextflow version to run the pipeline.
         wf_path (str): Path to the pipeline directory.
@@ -185,6 +295,7 @@ class Pipeline:
         self.conda_package_info: dict = {}
         self.nf_config: dict = {}
         self.files: list[Path] = []
+        self.git_info: dict[Path, tuple[str, str]] = {}
         self.git_sha: str | None = None
         self.minNextflowVersion: str | None = None
         self.wf_path = Path(wf_path)
@@ -194,7 +305,10 @@ class Pipeline:
         self.repo: git.Repo | None = None
 
         try:
-            self.repo = git.Repo(self.wf_path)
+            # Imported here so that importing nf_core.utils on its own doesn't load GitPython, which is slow to import
+            from git import Repo
+
+            self.repo = Repo(self.wf_path)
             self.git_sha = self.repo.head.object.hexsha
         except Exception as e:
             log.debug(f"Could not find git hash for pipeline: {self.wf_path}. {e}")
@@ -215,7 +329,7 @@ class Pipeline:
         """Try to load the pipeline environment.yml file, if it exists"""
         try:
             with open(Path(self.wf_path, "environment.yml")) as fh:
-                self.conda_config = yaml.safe_load(fh)
+                self.conda_config = yaml.load(fh, Loader=YAML_SAFE_LOADER)
             return True
         except FileNotFoundError:
             log.debug("No conda `environment.yml` file found.")
@@ -230,20 +344,33 @@ class Pipeline:
         files = []
         try:
             # First, try to get the list of files using git
-            git_ls_files = subprocess.check_output(["git", "ls-files"], cwd=self.wf_path).splitlines()
-            for fn in git_ls_files:
-                full_fn = Path(self.wf_path) / fn.decode("utf-8")
-                if full_fn.is_file():
+            # Get the mode and object hash of every file in the index in a single call, for later lookups
+            git_ls_files = subprocess.check_output(["git", "ls-files", "-z", "--stage"], cwd=self.wf_path)
+            git_info: dict[Path, tuple[str, str]] = {}
+            for git_entry in git_ls_files.split(b"\0"):
+                if not git_entry:
+                    continue
+                git_meta, _, fn = git_entry.partition(b"\t")
+                mode, sha, _ = git_meta.decode("utf-8").split()
+                git_info[Path(self.wf_path) / os.fsdecode(fn)] = (mode, sha)
+            self.git_info = git_info
+            tracked_files = list(git_info)
+            # Scan each parent directory once instead of calling stat on every single file
+            existing_files: set[Path] = set()
+            for parent in {fn.parent for fn in tracked_files}:
+                try:
+                    with os.scandir(parent) as entries:
+                        existing_files.update(parent / entry.name for entry in entries if entry.is_file())
+                except OSError:
+                    pass
+            for full_fn in tracked_files:
+                if full_fn in existing_files:
                     files.append(full_fn)
                 else:
                     log.debug(f"`git ls-files` returned '{full_fn}' but could not open it!")
         except subprocess.CalledProcessError:
             # Failed, so probably not initialised as a git repository - just a list of all files
-            files = []
-            for file_path in self.wf_path.rglob("*"):
-                if file_path.is_file():
-                    # Append the file path to the list
-                    files.append(file_path)
+            files = [Path(fn) for fn in _scan_files(self.wf_path)]
             if len(files) == 0:
                 log.debug(f"No files found in pipeline: {self.wf_path}")
 
@@ -258,7 +385,7 @@ class Pipeline:
 
         self.pipeline_prefix, self.pipeline_name = self.nf_config.get("manifest.name", "/").strip("'").split("/")
 
-        nextflow_version_match = re.search(r"[0-9\.]+(-edge)?", self.nf_config.get("manifest.nextflowVersion", ""))
+        nextflow_version_match = NF_VERSION_RE.search(self.nf_config.get("manifest.nextflowVersion", ""))
         if nextflow_version_match:
             self.minNextflowVersion = nextflow_version_match.group(0)
             return True
@@ -354,10 +481,24 @@ def check_nextflow_version(minimal_nf_version: tuple[int, int, int, bool], silen
     return nf_version >= minimal_nf_version
 
 
+# Pipeline version declared in nextflow.config, either as `manifest.version = ` or inside a `manifest { }` block
+MANIFEST_VERSION_RE = re.compile(rb"""manifest(?:\.|\s*\{[^}]*?\b)version\s*=\s*['"]([^'"]+)['"]""")
+
+# Parameter declarations in main.nf, for example `params.input = null`
+MAIN_NF_PARAM_RE = re.compile(rb"^[ \t]*(params\.[a-zA-Z0-9_]+)[ \t]*=(?!=)", re.MULTILINE)
+
+# Configs already loaded by fetch_wf_config() in this process, keyed on pipeline path and config cache file name
+_WF_CONFIG_CACHE: dict[tuple[Path, str], dict] = {}
+
+
 def fetch_wf_config(wf_path: Path, cache_config: bool = True) -> dict:
     """Uses Nextflow to retrieve the the configuration variables
     from a Nextflow workflow.
 
+    The cache is keyed on the size and modification time of ``nextflow.config``
+    and ``main.nf``. Set ``$NFCORE_STRICT_CACHE`` to key it on file contents instead.
+    In strict mode, ``main.nf`` is only hashed if ``nextflow.config`` has no ``manifest.version``.
+
     Args:
         wf_path (str): Nextflow workflow file system path.
         cache_config (bool): cache configuration or not (def. True)
@@ -372,6 +513,7 @@ def fetch_wf_config(wf_path: Path, cache_config: bool = True) -> dict:
     cache_fn = None
     cache_basedir = None
     cache_path = None
+    memo_key: tuple[Path, str] | None = None
 
     # Nextflow home directory - use env var if set, or default to ~/.nextflow
     nxf_home = Path(os.environ.get("NXF_HOME", Path(os.getenv("HOME") or "", ".nextflow")))
@@ -384,18 +526,61 @@ def fetch_wf_config(wf_path: Path, cache_config: bool = True) -> dict:
 
     # If we're given a workflow object with a commit, see if we have a cached copy
     cache_fn = None
-    # Make a filename based on file contents
-    concat_hash = ""
-    for fn in ["nextflow.config", "main.nf"]:
+    if os.environ.get("NFCORE_STRICT_CACHE", False):
+        # Make a filename based on file contents, hashing both files in a single pass
+        content_hash = hashlib.blake2b(digest_size=16)
+        hashed_files = 0
+        manifest_version_match = None
         try:
-            with open(wf_path / fn, "rb") as fh:
-                concat_hash += hashlib.sha256(fh.read()).hexdigest()
+            # nextflow.config is small, so read it in one go and look for a pipeline version
+            with open(wf_path / "nextflow.config", "rb") as fh:
+                nf_config_content = fh.read()
+            content_hash.update(b"nextflow.config")
+            content_hash.update(nf_config_content)
+            manifest_version_match = MANIFEST_VERSION_RE.search(nf_config_content)
+            hashed_files += 1
+        except FileNotFoundError:
+            pass
+        try:
+            main_nf = wf_path / "main.nf"
+            if manifest_version_match:
+                # Versioned pipeline, so the size and modification time of main.nf are enough
+                main_nf_stat = os.stat(main_nf)
+                content_hash.update(b"main.nf")
+                content_hash.update(struct.pack("<qq", main_nf_stat.st_size, main_nf_stat.st_mtime_ns))
+            else:
+                with open(main_nf, "rb") as fh:
+                    content_hash.update(b"main.nf")
+                    for chunk in iter(lambda: fh.read(io.DEFAULT_BUFFER_SIZE), b""):
+                        content_hash.update(chunk)
+            hashed_files += 1
         except FileNotFoundError:
             pass
-    # Hash the hash
-    if len(concat_hash) > 0:
-        bighash = hashlib.sha256(concat_hash.encode("utf-8")).hexdigest()
-        cache_fn = f"wf-config-cache-{bighash[:25]}.json"
+        if hashed_files > 0:
+            cache_fn = f"wf-config-cache-{content_hash.hexdigest()[:25]}.json"
+    else:
+        # Make a filename based on file sizes and modification times, without reading the files
+        stat_hash = hashlib.blake2b(digest_size=16)
+        hashed_files = 0
+        for fn in ["nextflow.config", "main.nf"]:
+            try:
+                file_stat = os.stat(wf_path / fn)
+            except FileNotFoundError:
+                continue
+            # Feed the raw numbers to the hash, rather than formatting them as text first
+            stat_hash.update(fn.encode("utf-8"))
+            stat_hash.update(struct.pack("<qq", file_stat.st_size, file_stat.st_mtime_ns))
+            hashed_files += 1
+        if hashed_files > 0:
+            cache_fn = f"wf-config-cache-{stat_hash.hexdigest()[:25]}.json"
+
+    # Reuse the result of an earlier call in this process if the pipeline files haven't changed since,
+    # even if there is no cache directory
+    if cache_config and cache_fn:
+        memo_key = (wf_path.resolve(), cache_fn)
+        if memo_key in _WF_CONFIG_CACHE:
+            log.debug(f"Using config loaded earlier in this session: {cache_fn}")
+            return dict(_WF_CONFIG_CACHE[memo_key])
 
     if cache_basedir and cache_fn:
         cache_path = Path(cache_basedir, cache_fn)
@@ -404,6 +589,8 @@ def fetch_wf_config(wf_path: Path, cache_config: bool = True) -> dict:
             try:
                 with open(cache_path) as fh:
                     config = json.load(fh)
+                if memo_key:
+                    _WF_CONFIG_CACHE[memo_key] = dict(config)
                 return config
             except json.JSONDecodeError as e:
                 # Log warning but don't raise - just regenerate the cache
@@ -419,32 +606,39 @@ def fetch_wf_config(wf_path: Path, cache_config: bool = True) -> dict:
     result = run_cmd("nextflow", f"config -flat {wf_path}")
     if result is not None:
         nfconfig_raw, _ = result
-        nfconfig = nfconfig_raw.decode("utf-8")
-        multiline_key_value_pattern = re.compile(r"(^|\n)([^\n=\s]+?)\s*=\s*((?:(?!\n[^\n=]+?\s*=).)*)", re.DOTALL)
-
-        for config_match in multiline_key_value_pattern.finditer(nfconfig):
-            k = config_match.group(2).strip()
-            v = config_match.group(3).strip().strip("'\"")
-            if k and v == "":
+        # Lines without an `=` continue the value of the previous key, for multi-line values
+        config_value_lines: dict[str, list[str]] = {}
+        value_lines: list[str] | None = None
+        for line in nfconfig_raw.decode("utf-8").splitlines():
+            k, sep, v = line.partition("=")
+            # Config keys have no whitespace in them, only padding before the `=`
+            key = k.rstrip()
+            if sep and key and not any(c.isspace() for c in key):
+                value_lines = [v]
+                config_value_lines[key] = value_lines
+            elif sep and k:
+                log.debug(f"Couldn't find key=value config pair:\n  {line}")
+                value_lines = None
+            elif value_lines is not None:
+                value_lines.append(line)
+
+        for k, lines in config_value_lines.items():
+            v = "\n".join(lines).strip().strip("'\"")
+            if v == "":
                 config[k] = "null"
                 log.debug(f"Config key: {k}, value: empty string")
-            elif k and v:
+            else:
                 config[k] = v
                 log.debug(f"Config key: {k}, value: {v}")
-            else:
-                log.debug(f"Couldn't find key=value config pair:\n  {config_match.group(0)}")
-            del config_match
 
     # Scrape main.nf for additional parameter declarations
     # Values in this file are likely to be complex, so don't both trying to capture them. Just get the param name.
     try:
         main_nf = Path(wf_path, "main.nf")
         with open(main_nf, "rb") as fh:
-            for line in fh:
-                line_str = line.decode("utf-8")
-                match = re.match(r"^\s*(params\.[a-zA-Z0-9_]+)\s*=(?!=)", line_str)
-                if match and match.group(1):
-                    config[match.group(1)] = "null"
+            main_nf_content = fh.read()
+        for match in MAIN_NF_PARAM_RE.finditer(main_nf_content):
+            config[match.group(1).decode("utf-8")] = "null"
 
     except FileNotFoundError as e:
         log.debug(f"Could not open {main_nf} to look for parameter declarations - {e}")
@@ -458,6 +652,8 @@ def fetch_wf_config(wf_path: Path, cache_config: bool = True) -> dict:
         log.debug(f"Saving config cache: {cache_path}")
         with open(cache_path, "w") as fh:
             json.dump(config, fh, indent=4)
+    if memo_key:
+        _WF_CONFIG_CACHE[memo_key] = dict(config)
 
     return config
 
@@ -531,15 +727,17 @@ def setup_nfcore_cachedir(cache_fn: str | Path) -> Path:
     return cachedir
 
 
-def wait_cli_function(poll_func: Callable[[], bool], refresh_per_second: int = 20) -> None:
+def wait_cli_function(poll_func: Callable[[], bool], refresh_per_second: int = 20, poll_every: float = 5) -> None:
     """
     Display a command-line spinner while calling a function repeatedly.
 
-    Keep waiting until that function returns True
+    Keep waiting until that function returns True. The wait between calls starts
+    short and grows, so quick responses are picked up fast and long waits make fewer calls.
 
     Arguments:
        poll_func (function): Function to call
        refresh_per_second (int): Refresh this many times per second. Default: 20.
+       poll_every (float): Maximum number of seconds to wait between calls. Default: 5.
 
     Returns:
        None. Just sits in an infinite loop until the function returns True.
@@ -547,10 +745,12 @@ def wait_cli_function(poll_func: Callable[[], bool], refresh_per_second: int = 2
     try:
         spinner = Spinner("dots2", "Use ctrl+c to stop waiting and force exit.")
         with Live(spinner, refresh_per_second=refresh_per_second):
+            wait_time = min(0.5, poll_every)
             while True:
                 if poll_func():
                     break
-                time.sleep(2)
+                time.sleep(wait_time)
+                wait_time = min(wait_time * 1.5, poll_every)
     except KeyboardInterrupt:
         raise AssertionError("Cancelled!")
 
@@ -563,45 +763,41 @@ def poll_nfcore_web_api(api_url: str, post_data: dict | None = None) -> dict:
 
     Expects API response to be valid JSON and contain a top-level 'status' key.
     """
-    # Run without requests_cache so that we get the updated statuses
-    with requests_cache.disabled():
+    # nfcore_web_session doesn't use requests_cache, so we always get the updated statuses
+    try:
+        if post_data is None:
+            response = nfcore_web_session.get(api_url, headers={"Cache-Control": "no-cache"})
+        else:
+            log.debug(f"requesting {api_url} with {post_data}")
+            response = nfcore_web_session.post(url=api_url, data=post_data)
+    except requests.exceptions.Timeout:
+        raise AssertionError(f"URL timed out: {api_url}")
+    except requests.exceptions.ConnectionError:
+        raise AssertionError(f"Could not connect to URL: {api_url}")
+    else:
+        if response.status_code != 200 and response.status_code != 301:
+            response_content = response.content
+            if isinstance(response_content, bytes):
+                response_content = response_content.decode()
+            log.debug(f"Response content:\n{response_content}")
+            raise AssertionError(f"Could not access remote API results: {api_url} (HTML {response.status_code} Error)")
+        # follow redirects
+        if response.status_code == 301:
+            return poll_nfcore_web_api(response.headers["Location"], post_data)
         try:
-            if post_data is None:
-                response = requests.get(api_url, headers={"Cache-Control": "no-cache"})
-            else:
-                log.debug(f"requesting {api_url} with {post_data}")
-                response = requests.post(url=api_url, data=post_data)
-        except requests.exceptions.Timeout:
-            raise AssertionError(f"URL timed out: {api_url}")
-        except requests.exceptions.ConnectionError:
-            raise AssertionError(f"Could not connect to URL: {api_url}")
+            web_response = json.loads(response.content)
+            if "status" not in web_response:
+                raise AssertionError()
+        except (json.decoder.JSONDecodeError, AssertionError, TypeError):
+            response_content = response.content
+            if isinstance(response_content, bytes):
+                response_content = response_content.decode()
+            log.debug(f"Response content:\n{response_content}")
+            raise AssertionError(
+                f"nf-core website API results response not recognised: {api_url}\n See verbose log for full response"
+            )
         else:
-            if response.status_code != 200 and response.status_code != 301:
-                response_content = response.content
-                if isinstance(response_content, bytes):
-                    response_content = response_content.decode()
-                log.debug(f"Response content:\n{response_content}")
-                raise AssertionError(
-                    f"Could not access remote API results: {api_url} (HTML {response.status_code} Error)"
-                )
-            # follow redirects
-            if response.status_code == 301:
-                return poll_nfcore_web_api(response.headers["Location"], post_data)
-            try:
-                web_response = json.loads(response.content)
-                if "status" not in web_response:
-                    raise AssertionError()
-            except (json.decoder.JSONDecodeError, AssertionError, TypeError):
-                response_content = response.content
-                if isinstance(response_content, bytes):
-                    response_content = response_content.decode()
-                log.debug(f"Response content:\n{response_content}")
-                raise AssertionError(
-                    f"nf-core website API results response not recognised: {api_url}\n "
-                    "See verbose log for full response"
-                )
-            else:
-                return web_response
+            return web_response
 
 
 class GitHubAPISession(requests_cache.CachedSession):
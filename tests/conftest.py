@@ -4,6 +4,8 @@ import os
 import shutil
 import tempfile
 
+import pytest
+
 
 def pytest_configure(config):
     """Configure pytest before any tests run - set up worker-specific cache directories."""
@@ -51,3 +53,14 @@ def pytest_unconfigure(config):
             shutil.rmtree(config._temp_config_dir)
         except (OSError, FileNotFoundError):
             pass
+
+
+@pytest.fixture(autouse=True)
+def clear_wf_config_cache():
+    """Don't let configs loaded by fetch_wf_config() in one test leak into the next."""
+    # Imported here, as nf_core.utils reads XDG_CACHE_HOME / XDG_CONFIG_HOME on import, which must follow pytest_configure
+    import nf_core.utils
+
+    nf_core.utils._WF_CONFIG_CACHE.clear()
+    yield
+    nf_core.utils._WF_CONFIG_CACHE.clear()
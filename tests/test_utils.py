@@ -1,6 +1,8 @@
 """Tests covering for utility functions."""
 
+import json
 import os
+import threading
 from pathlib import Path
 from unittest import mock
 
@@ -26,6 +28,21 @@ def test_strip_ansi_codes():
     assert stripped == "ls examplefile.zip"
 
 
+def test_manifest_version_re():
+    """Check that we can find the pipeline version in both manifest notations"""
+    block = b"manifest {\n    name = 'nf-core/test'\n    nextflowVersion = '!>=25.04.0'\n    version = '1.0.0dev'\n}\n"
+    assert nf_core.utils.MANIFEST_VERSION_RE.search(block).group(1) == b"1.0.0dev"
+    assert nf_core.utils.MANIFEST_VERSION_RE.search(b"manifest.version = '2.1'").group(1) == b"2.1"
+    assert nf_core.utils.MANIFEST_VERSION_RE.search(b"manifest {\n}\nparams.version = '3'") is None
+
+
+def join_version_check_threads():
+    """Wait for background version checks to finish, before their temporary cache folder is removed"""
+    for thread in threading.enumerate():
+        if thread.name == "nf-core-version-check":
+            thread.join(timeout=5)
+
+
 class TestUtils(TestPipelines):
     """Class for utils tests"""
 
@@ -59,6 +76,70 @@ class TestUtils(TestPipelines):
         is_outdated, current, remote = nf_core.utils.check_if_outdated(current_version, remote_version)
         assert is_outdated
 
+    def test_check_if_outdated_invalid_remote(self):
+        current_version = "1.0"
+        remote_version = ""
+        is_outdated, current, remote = nf_core.utils.check_if_outdated(current_version, remote_version)
+        assert not is_outdated
+
+    @mock.patch("nf_core.utils.fetch_remote_version")
+    @with_temporary_folder
+    def test_check_if_outdated_timeout(self, mock_fetch_remote_version, tmpdir):
+        """Check that a slow version check is reported as not outdated"""
+        # Don't answer until the check has given up, then let the background thread finish
+        release = threading.Event()
+
+        def slow_fetch(source_url):
+            release.wait()
+            return "2.0"
+
+        mock_fetch_remote_version.side_effect = slow_fetch
+        try:
+            with mock.patch("nf_core.utils.VERSION_CHECK_CACHE", Path(tmpdir, "version_check.json")):
+                is_outdated, current, remote = nf_core.utils.check_if_outdated("1.0", timeout=0.01)
+            assert not is_outdated
+            assert remote is None
+        finally:
+            release.set()
+            join_version_check_threads()
+
+    @mock.patch("nf_core.utils.fetch_remote_version")
+    @with_temporary_folder
+    def test_check_if_outdated_cached(self, mock_fetch_remote_version, tmpdir):
+        """Check that the version check result is reused, also after a failed check"""
+        mock_fetch_remote_version.side_effect = requests.exceptions.ConnectionError()
+        with mock.patch("nf_core.utils.VERSION_CHECK_CACHE", Path(tmpdir, "version_check.json")):
+            assert nf_core.utils.check_if_outdated("1.0")[2] is None
+            assert nf_core.utils.check_if_outdated("1.0")[2] is None
+            assert mock_fetch_remote_version.call_count == 1
+            # A new release gets its own check
+            mock_fetch_remote_version.side_effect = None
+            mock_fetch_remote_version.return_value = "2.0"
+            assert nf_core.utils.check_if_outdated("1.1") == (True, "1.1", "2.0")
+
+    @mock.patch("nf_core.utils.fetch_remote_version")
+    @with_temporary_folder
+    def test_check_if_outdated_timeout_cached(self, mock_fetch_remote_version, tmpdir):
+        """Check that a timed out version check is saved, even if the background thread never finishes"""
+        release = threading.Event()
+
+        def slow_fetch(source_url):
+            release.wait()
+            raise requests.exceptions.ConnectionError()
+
+        mock_fetch_remote_version.side_effect = slow_fetch
+        cache_file = Path(tmpdir, "version_check.json")
+        try:
+            with mock.patch("nf_core.utils.VERSION_CHECK_CACHE", cache_file):
+                assert nf_core.utils.check_if_outdated("1.0", timeout=0.01)[2] is None
+                assert json.loads(cache_file.read_text())["remote_version"] is None
+                # The next run reuses the saved attempt instead of waiting again
+                assert nf_core.utils.check_if_outdated("1.0", timeout=0.01)[2] is None
+                assert mock_fetch_remote_version.call_count == 1
+        finally:
+            release.set()
+            join_version_check_threads()
+
     def test_rich_force_colours_false(self):
         os.environ.pop("GITHUB_ACTIONS", None)
         os.environ.pop("FORCE_COLOR", None)
@@ -88,6 +169,20 @@ class TestUtils(TestPipelines):
         files = self.pipeline_obj.list_files()
         assert Path(self.pipeline_dir, "main.nf") in files
 
+    def test_list_files_git_info(self):
+        """Test that listing pipeline files with git also collects their git object info"""
+        self.pipeline_obj.list_files()
+        mode, sha = self.pipeline_obj.git_info[Path(self.pipeline_dir, "main.nf")]
+        assert mode == "100644"
+        assert len(sha) == 40
+
+    def test_list_files_git_deleted(self):
+        """Test that tracked files which are missing on disk are not listed"""
+        Path(self.pipeline_dir, "main.nf").unlink()
+        files = self.pipeline_obj.list_files()
+        assert Path(self.pipeline_dir, "main.nf") not in files
+        assert Path(self.pipeline_dir, "nextflow.config") in files
+
     @with_temporary_folder
     def test_list_files_no_git(self, tmpdir):
         """Test listing pipeline files without `git-ls`"""
@@ -98,6 +193,24 @@ class TestUtils(TestPipelines):
         files = pipeline_obj.list_files()
         assert tmp_fn in files
 
+    @with_temporary_folder
+    def test_list_files_no_git_skips_work_dir(self, tmpdir):
+        """Test that Nextflow run directories are not listed without `git-ls`"""
+        Path(tmpdir, "work", "ab").mkdir(parents=True)
+        Path(tmpdir, "work", "ab", "testfile").touch()
+        Path(tmpdir, "main.nf").touch()
+        pipeline_obj = nf_core.utils.Pipeline(tmpdir)
+        files = pipeline_obj.list_files()
+        assert files == [Path(tmpdir, "main.nf")]
+
+    @with_temporary_folder
+    def test_list_files_no_git_unreadable_dir(self, tmpdir):
+        """Test that directories which can't be read are skipped without `git-ls`"""
+        Path(tmpdir, "main.nf").touch()
+        with mock.patch("os.scandir", side_effect=PermissionError("Permission denied")):
+            files = nf_core.utils.Pipeline(tmpdir).list_files()
+        assert files == []
+
     @mock.patch("pathlib.Path.mkdir")
     @mock.patch("pathlib.Path.exists")
     def test_request_cant_create_cache(self, mock_exists, mock_mkdir):
@@ -106,6 +219,14 @@ class TestUtils(TestPipelines):
         mock_mkdir.side_effect = PermissionError()
         nf_core.utils.setup_requests_cachedir()
 
+    @mock.patch("time.sleep")
+    def test_wait_cli_function_backoff(self, mock_sleep):
+        """Test that the wait between polls grows up to poll_every"""
+        poll_func = mock.Mock(side_effect=[False] * 6 + [True])
+        nf_core.utils.wait_cli_function(poll_func, poll_every=2)
+        assert poll_func.call_count == 7
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 0.75, 1.125, 1.6875, 2, 2]
+
     def test_pip_package_pass(self):
         result = nf_core.utils.pip_package("multiqc=1.32")
         assert isinstance(result, dict)
@@ -225,6 +346,41 @@ class TestUtils(TestPipelines):
         assert len(config.keys()) == 1
         assert "params.param2" in list(config.keys())
 
+    @mock.patch("nf_core.utils.run_cmd")
+    def test_fetch_wf_config_multiline(self, mock_run_cmd):
+        """Test that fetch_wf_config() keeps multi-line config values together."""
+        mock_run_cmd.return_value = (b"params.list = [\n  'a',\n  'b'\n]\nparams.empty = ''\nparams.x = 5", b"mock")
+        config = nf_core.utils.fetch_wf_config(".", False)
+        assert config == {"params.list": "[\n  'a',\n  'b'\n]", "params.empty": "null", "params.x": "5"}
+
+    @mock.patch("nf_core.utils.run_cmd")
+    @with_temporary_folder
+    def test_fetch_wf_config_cache(self, mock_run_cmd, tmpdir):
+        """Test that the config cache is reused until a pipeline file changes"""
+        mock_run_cmd.return_value = (b"params.param1 = foo", b"mock")
+        wf_path = Path(tmpdir, "pipeline")
+        wf_path.mkdir()
+        Path(wf_path, "nextflow.config").write_text("params.param1 = foo\n")
+        with mock.patch.dict(os.environ, {"NXF_HOME": str(tmpdir)}):
+            nf_core.utils.fetch_wf_config(wf_path)
+            nf_core.utils.fetch_wf_config(wf_path)
+            assert mock_run_cmd.call_count == 1
+            Path(wf_path, "nextflow.config").write_text("params.param1 = foobar\n")
+            nf_core.utils.fetch_wf_config(wf_path)
+            assert mock_run_cmd.call_count == 2
+
+    @mock.patch("nf_core.utils.run_cmd")
+    @with_temporary_folder
+    def test_fetch_wf_config_in_process_cache(self, mock_run_cmd, tmpdir):
+        """Test that the config is reused within a process without a cache directory"""
+        mock_run_cmd.return_value = (b"params.param1 = foo", b"mock")
+        Path(tmpdir, "nextflow.config").write_text("params.param1 = foo\n")
+        with mock.patch.dict(os.environ, {"NXF_HOME": str(Path(tmpdir, "missing"))}):
+            config = nf_core.utils.fetch_wf_config(tmpdir)
+            config["params.param1"] = "changed"
+            assert nf_core.utils.fetch_wf_config(tmpdir) == {"params.param1": "foo"}
+            assert mock_run_cmd.call_count == 1
+
     @with_temporary_folder
     def test_get_wf_files(self, tmpdir):
         tmpdir = Path(tmpdir)